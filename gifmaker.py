@@ -1,7 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+import queue
+import importlib.util
 import os
+import stat
 import tempfile
 import shutil
 import subprocess
@@ -9,6 +12,9 @@ import sys
 import time
 import re
 import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import webbrowser
 from typing import Optional, List, Dict, Any, Callable, Tuple
@@ -19,15 +25,10 @@ def check_and_install_dependencies():
     required = {'yt_dlp': 'yt-dlp', 'PIL': 'Pillow', 'requests': 'requests'}
     if sys.platform == 'win32':
         required['wmi'] = 'wmi'
-    missing = []
-    for module, package in required.items():
-        try:
-            if module == 'PIL':
-                from PIL import Image, ImageTk
-            else:
-                __import__(module)
-        except ImportError:
-            missing.append(package)
+    # find_spec only consults importer metadata, so the common
+    # everything-installed case pays no module execution at startup
+    missing = [package for module, package in required.items()
+               if importlib.util.find_spec(module) is None]
     if missing:
         msg = f"Required modules not found: {', '.join(missing)}.\n\nInstall them automatically using pip?"
         if messagebox.askyesno("Dependency Check", msg):
@@ -57,33 +58,93 @@ if sys.platform == 'win32':
 # --- Constants ---
 URL_PLACEHOLDER = "Insert URL (YouTube, etc.)"
 TEMP_GIF_FILENAME = "output.gif"
-TEMP_PALETTE_FILENAME = "palette.png"
+CONFIG_PATH = Path.home() / ".gif_studio_pro.json"
+
+# Per-quality (palettegen options, paletteuse options), interned once at
+# import instead of rebuilding both dicts on every GIF run
+QUALITY_PRESETS = {
+    'fast': ('stats_mode=single', 'dither=none'),
+    'medium': ('stats_mode=diff', 'dither=bayer:bayer_scale=2'),
+    'high': ('stats_mode=diff:max_colors=256', 'dither=floyd_steinberg'),
+}
+
+@lru_cache(maxsize=64)
+def build_filter_graph(width: int, fps: int, quality: str) -> str:
+    """Builds the single-pass palettegen/paletteuse filter graph.
+
+    Memoized so re-encodes with the same settings reuse the string
+    instead of redoing the preset lookup and f-string assembly."""
+    palette_gen, dither = QUALITY_PRESETS.get(quality, QUALITY_PRESETS['medium'])
+    return (
+        f'[0:v]fps={fps},scale={width}:-1:flags=lanczos,split[a][b];'
+        f'[a]palettegen={palette_gen}[p];'
+        f'[b][p]paletteuse={dither}:diff_mode=rectangle'
+    )
+
+# Compiled once instead of per call inside get_video_info
+DURATION_RE = re.compile(r"Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})")
+
+# Candidate FFmpeg locations beyond PATH, frozen at import; the app never
+# changes its working directory, so the cwd-relative entries stay valid
+FFMPEG_NAMES = ('ffmpeg.exe', 'ffmpeg') if sys.platform == 'win32' else ('ffmpeg',)
+FFMPEG_LOCAL_PATHS = (
+    Path.cwd() / "ffmpeg.exe",
+    Path.cwd() / "ffmpeg",
+    Path.cwd() / "bin" / "ffmpeg.exe",
+    Path.cwd() / "bin" / "ffmpeg",
+)
+if sys.platform == 'win32':
+    FFMPEG_SYSTEM_PATHS = (
+        Path("C:/ffmpeg/bin/ffmpeg.exe"),
+        Path("C:/Program Files/ffmpeg/bin/ffmpeg.exe"),
+        Path("C:/Program Files (x86)/ffmpeg/bin/ffmpeg.exe"),
+    )
+else:
+    FFMPEG_SYSTEM_PATHS = (
+        Path("/usr/bin/ffmpeg"),
+        Path("/usr/local/bin/ffmpeg"),
+        Path("/opt/homebrew/bin/ffmpeg"),
+    )
+
+# --- Utility Functions ---
+_which_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
+def cached_which(name: str) -> Optional[str]:
+    """shutil.which with a memo keyed by PATH, so repeat lookups (hits and
+    misses alike) skip walking every PATH entry again."""
+    key = (name, os.environ.get('PATH', ''))
+    if key not in _which_cache:
+        _which_cache[key] = shutil.which(name)
+    return _which_cache[key]
+
+def open_url_async(url: str):
+    """Opens a URL in the browser without blocking the Tk thread."""
+    threading.Thread(target=webbrowser.open, args=(url,), kwargs={'new': 2}, daemon=True).start()
 
 # --- Utility Classes ---
-class CancellableThread(threading.Thread):
-    """A thread that can be safely stopped."""
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._stop_event = threading.Event()
-
-    def stop(self):
-        """Sets the stop flag."""
-        self._stop_event.set()
-
-    def stopped(self) -> bool:
-        """Checks if the stop flag was set."""
-        return self._stop_event.is_set()
-
 class FFmpegProcessManager:
     """Manages launching, tracking progress and canceling FFmpeg process."""
-    def __init__(self, command: List[str], progress_callback: Callable, completion_callback: Callable, total_duration: float = 0):
-        self.command = command
+
+    # Keys emitted by -progress; anything else on the merged pipe is a diagnostic
+    _PROGRESS_KEYS = frozenset((
+        b'frame', b'fps', b'stream_0_0_q', b'bitrate', b'total_size',
+        b'out_time_us', b'out_time_ms', b'out_time', b'dup_frames',
+        b'drop_frames', b'speed', b'progress'
+    ))
+
+    def __init__(self, command: List[Any], progress_callback: Callable, completion_callback: Callable, total_duration: float = 0):
+        # Stringified once here; callers hand over resolved Path objects
+        # or ready strings, so no per-run conversion pass is needed
+        self.command = [str(arg) for arg in command]
         self.progress_callback = progress_callback
         self.completion_callback = completion_callback
         self.total_duration = total_duration
+        # Pre-scaled so each progress record needs one multiply and one divide
+        self._total_us = int(total_duration * 1_000_000)
         self.process: Optional[subprocess.Popen] = None
         self.thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._last_progress = -1.0
 
     def run(self):
         """Starts FFmpeg process in a separate thread."""
@@ -93,15 +154,14 @@ class FFmpegProcessManager:
     def _run_process(self):
         """Internal method with improved FFmpeg process handling."""
         try:
-            # Fixed command preparation
-            cmd_str = []
-            for arg in self.command:
-                if isinstance(arg, Path):
-                    # Use absolute paths and proper escaping
-                    path_str = str(arg.resolve().as_posix()) if sys.platform != 'win32' else str(arg.resolve())
-                    cmd_str.append(path_str)
-                else:
-                    cmd_str.append(str(arg))
+            cmd_str = list(self.command)
+
+            # Machine-readable progress records on stdout instead of the
+            # human stats on stderr: one key=value pair per line, no regex.
+            # -loglevel warning keeps the merged pipe down to real
+            # diagnostics, so callers never need their own log flags
+            cmd_str[1:1] = ['-hide_banner', '-nostats', '-loglevel', 'warning',
+                            '-progress', 'pipe:1']
 
             print(f"Executing: {' '.join(cmd_str)}")  # Debug output
 
@@ -112,57 +172,53 @@ class FFmpegProcessManager:
                 startupinfo.wShowWindow = subprocess.SW_HIDE
 
             # Improved process startup parameters
+            # Byte pipes: progress records are parsed as bytes, so nothing
+            # pays for UTF-8 decoding except the few diagnostic lines.
+            # stderr is merged into stdout so a single reader thread serves
+            # both streams (selectors can't poll pipes on Windows).
             self.process = subprocess.Popen(
                 cmd_str,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,  # Changed: separate thread for stderr
-                universal_newlines=True,
-                encoding='utf-8',
-                errors='replace',
+                stderr=subprocess.STDOUT,
+                bufsize=1 << 16,  # 64 KiB BufferedReader on our side: fewer read
+                                  # syscalls; the reader thread is what keeps
+                                  # the OS pipe drained so ffmpeg never stalls
                 startupinfo=startupinfo,
-                cwd=str(Path.cwd()),
-                env=os.environ.copy()  # Added: environment copying
+                cwd=str(Path.cwd())
             )
 
-            # Read stdout and stderr in parallel
-            output_log = []
-            error_log = []
-            last_progress = -1
-
-            def read_stdout():
-                for line in iter(self.process.stdout.readline, ''):
-                    if self._stop_event.is_set():
-                        break
-                    line = line.strip()
-                    if line:
-                        output_log.append(line)
-                        self._process_output_line(line, last_progress)
-
-            def read_stderr():
-                for line in iter(self.process.stderr.readline, ''):
-                    if self._stop_event.is_set():
+            # Bounded: only the tail is ever shown, so don't hoard a
+            # whole render's worth of warnings
+            error_log = deque(maxlen=100)
+            self._last_progress = -1.0
+
+            def read_output():
+                # No strip() in the hot path: int() tolerates the trailing
+                # newline and key matching only looks left of '=', so
+                # progress lines are scanned without any extra allocation.
+                # Everything the loop touches is pre-bound to a local.
+                readline = self.process.stdout.readline
+                stopped = self._stop_event.is_set
+                handle_progress = self._process_progress_line
+                log_error = error_log.append
+                for line in iter(readline, b''):
+                    if stopped():
                         break
-                    line = line.strip()
-                    if line:
-                        error_log.append(line)
-                        self._process_output_line(line, last_progress)
+                    if len(line) > 1 and not handle_progress(line):
+                        stripped = line.strip()
+                        if stripped:
+                            log_error(stripped.decode('utf-8', errors='replace'))
 
-            # Start reading in separate threads
-            stdout_thread = threading.Thread(target=read_stdout, daemon=True)
-            stderr_thread = threading.Thread(target=read_stderr, daemon=True)
-
-            stdout_thread.start()
-            stderr_thread.start()
+            reader_thread = threading.Thread(target=read_output, daemon=True)
+            reader_thread.start()
 
             # Wait for process completion
             return_code = self.process.wait()
 
             # Wait for output reading completion
-            stdout_thread.join(timeout=2)
-            stderr_thread.join(timeout=2)
+            reader_thread.join(timeout=2)
 
             self.process.stdout.close()
-            self.process.stderr.close()
 
             if self._stop_event.is_set():
                 self.completion_callback(-2, "Process canceled by user")
@@ -171,15 +227,15 @@ class FFmpegProcessManager:
                 if return_code > 2147483647:  # Fix for large unsigned values
                     return_code = return_code - 4294967296
 
-                all_logs = output_log + error_log
-                error_lines = [line for line in all_logs if
+                log_tail = list(error_log)
+                error_lines = [line for line in log_tail if
                             any(keyword in line.lower() for keyword in
                                 ['error', 'failed', 'not found', 'invalid', 'cannot', 'permission denied'])]
 
                 if error_lines:
                     error_msg = "\n".join(error_lines[-5:])  # Last 5 errors
                 else:
-                    error_msg = "\n".join(all_logs[-15:])  # Last 15 lines
+                    error_msg = "\n".join(log_tail[-15:])  # Last 15 lines
 
                 self.completion_callback(return_code, f"FFmpeg error (code {return_code}):\n{error_msg}")
             else:
@@ -190,32 +246,57 @@ class FFmpegProcessManager:
         except Exception as e:
             self.completion_callback(-1, f"Critical error: {str(e)}")
 
-    def _process_output_line(self, line: str, last_progress: float):
-        """Processes FFmpeg output line to extract progress."""
-        # Improved progress recognition
-        time_match = re.search(r"time=(\d{2}):(\d{2}):(\d{2})\.(\d{2})", line)
-        if time_match and self.total_duration > 0:
-            h, m, s, ms = map(int, time_match.groups())
-            current_time = h * 3600 + m * 60 + s + ms / 100
-            progress = min(100, (current_time / self.total_duration) * 100)
+    def _process_progress_line(self, line: bytes) -> bool:
+        """Processes one key=value record from FFmpeg's -progress stream.
+
+        Returns True if the line was a progress record, False for
+        diagnostics that should be logged instead.
+        """
+        key, _, value = line.partition(b'=')
+        if key not in self._PROGRESS_KEYS:
+            return False
+
+        # out_time_ms is historically microseconds too, same as out_time_us
+        if key in (b'out_time_us', b'out_time_ms') and self._total_us > 0:
+            try:
+                out_time_us = int(value)
+            except ValueError:
+                return True
+            progress = min(100.0, out_time_us * 100.0 / self._total_us)
 
             # Update only if progress changed significantly
-            if abs(progress - last_progress) > 0.5:
+            if abs(progress - self._last_progress) > 0.5:
                 self.progress_callback(progress, f"Processing: {progress:.1f}%")
-                last_progress = progress
-        elif "frame=" in line:
+                self._last_progress = progress
+        elif key == b'frame' and self._total_us <= 0:
             # Alternative progress tracking method
             self.progress_callback(-1, "Processing frames...")
+        return True
+
+    def _terminate_win32(self):
+        """Kills the process through the Win32 API - no taskkill subprocess."""
+        import ctypes
+        PROCESS_TERMINATE = 0x0001
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_TERMINATE, False, self.process.pid)
+        if handle:
+            try:
+                kernel32.TerminateProcess(handle, 1)
+            finally:
+                kernel32.CloseHandle(handle)
+        else:
+            # Could not get a handle (already gone or access denied);
+            # fall back to the shell tool
+            subprocess.call(['taskkill', '/F', '/T', '/PID', str(self.process.pid)],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
     def terminate(self):
         """Forcefully terminates FFmpeg process."""
         self._stop_event.set()
         if self.process and self.process.poll() is None:
             try:
-                # On Windows terminate() for ffmpeg may leave zombie processes
                 if sys.platform == 'win32':
-                    subprocess.call(['taskkill', '/F', '/T', '/PID', str(self.process.pid)],
-                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    self._terminate_win32()
                 else:
                     self.process.terminate()
                 self.process.wait(timeout=5)
@@ -236,13 +317,25 @@ class CustomWidgetHelper:
         self.colors = colors
         self.fonts = fonts
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _rounded_rect_points(x1: int, y1: int, x2: int, y2: int, radius: int) -> Tuple[int, ...]:
+        """Point sequence for a smoothed rounded rectangle, cached per
+        geometry - buttons and entries reuse a handful of sizes."""
+        # Anchor points walked clockwise; smoothing needs straight-edge
+        # anchors doubled and corner anchors single, hence the repeat count
+        anchors = (
+            (x1 + radius, y1, 2), (x2 - radius, y1, 2), (x2, y1, 1),
+            (x2, y1 + radius, 2), (x2, y2 - radius, 2), (x2, y2, 1),
+            (x2 - radius, y2, 2), (x1 + radius, y2, 2), (x1, y2, 1),
+            (x1, y2 - radius, 2), (x1, y1 + radius, 2), (x1, y1, 1),
+            (x1 + radius, y1, 1),
+        )
+        return tuple(c for x, y, n in anchors for c in (x, y) * n)
+
     def create_rounded_rect(self, canvas: tk.Canvas, x1: int, y1: int, x2: int, y2: int, radius: int, **kwargs):
         """Draws a rectangle with rounded corners on canvas."""
-        points = [
-            x1 + radius, y1, x1 + radius, y1, x2 - radius, y1, x2 - radius, y1, x2, y1, x2, y1 + radius,
-            x2, y1 + radius, x2, y2 - radius, x2, y2 - radius, x2, y2, x2 - radius, y2, x2 - radius, y2,
-            x1 + radius, y2, x1 + radius, y2, x1, y2, x1, y2 - radius, x1, y2 - radius, x1, y1 + radius,
-            x1, y1 + radius, x1, y1, x1 + radius, y1]
+        points = self._rounded_rect_points(x1, y1, x2, y2, radius)
         return canvas.create_polygon(points, **kwargs, smooth=True)
 
     def create_custom_button(self, parent: tk.Widget, text: str, command: Callable, width: int, height: int) -> tk.Canvas:
@@ -252,39 +345,44 @@ class CustomWidgetHelper:
         btn_shape = self.create_rounded_rect(canvas, 2, 2, width - 2, height - 2, 10, fill=self.colors['bg_accent'], outline="")
         btn_text = canvas.create_text(width / 2, height / 2, text=text, fill=self.colors['text_primary'], font=self.fonts['button'])
         glow_shape = self.create_rounded_rect(canvas, 1, 1, width - 1, height - 1, 11, outline="", fill="")
+        # Stacked under the button face once at creation; hovering only
+        # recolors the glow, it never reorders items again
+        canvas.tag_lower(glow_shape, btn_shape)
         canvas.state = 'normal'
 
-        def on_enter(e):
-            if canvas.state == 'normal':
-                canvas.itemconfig(glow_shape, fill=self.colors['accent'], outline=self.colors['accent'])
-                canvas.tag_lower(glow_shape, btn_shape)
-
-        def on_leave(e):
-            canvas.itemconfig(glow_shape, fill="")
+        # Hover glow handled entirely inside Tcl: mouse crossings never
+        # cross into Python. Disabling swaps the <Enter> script out.
+        widget_path = str(canvas)
+        accent = self.colors['accent']
+        glow_on = f'{widget_path} itemconfigure {glow_shape} -fill {accent} -outline {accent}'
+        glow_off = f'{widget_path} itemconfigure {glow_shape} -fill {{}} -outline {{}}'
+        canvas.tk.call('bind', widget_path, '<Enter>', glow_on)
+        canvas.tk.call('bind', widget_path, '<Leave>', glow_off)
 
         def on_click(e):
             if canvas.state == 'normal':
                 command()
 
-        canvas.bind("<Enter>", on_enter)
-        canvas.bind("<Leave>", on_leave)
         canvas.bind("<Button-1>", on_click)
 
         def configure_state(new_state: str):
+            if new_state == canvas.state:
+                return  # update_ui_state repeats states; skip the Tcl round trips
             canvas.state = new_state
             if new_state == 'disabled':
+                canvas.tk.call('bind', widget_path, '<Enter>', '')
                 canvas.itemconfig(btn_shape, fill=self.colors['disabled_bg'])
                 canvas.itemconfig(btn_text, fill=self.colors['disabled_fg'])
-                canvas.itemconfig(glow_shape, fill="")
-                on_leave(None)
+                canvas.itemconfig(glow_shape, fill="", outline="")
             else:
+                canvas.tk.call('bind', widget_path, '<Enter>', glow_on)
                 canvas.itemconfig(btn_shape, fill=self.colors['bg_accent'])
                 canvas.itemconfig(btn_text, fill=self.colors['text_primary'])
 
         canvas.configure_state = configure_state
         return canvas
 
-    def create_custom_entry(self, parent: tk.Widget, textvariable: tk.StringVar, validation_cmd: Tuple) -> Tuple[tk.Frame, tk.Entry]:
+    def create_custom_entry(self, parent: tk.Widget, textvariable: tk.StringVar, validation_cmd: Optional[Tuple] = None) -> Tuple[tk.Frame, tk.Entry]:
         """Creates custom input field."""
         container = tk.Frame(parent, bg=self.colors['bg_panel'])
         canvas = tk.Canvas(container, width=200, height=40, bg=self.colors['bg_panel'], highlightthickness=0)
@@ -293,10 +391,11 @@ class CustomWidgetHelper:
         self.create_rounded_rect(canvas, 1, 1, 199, 39, 10, fill=self.colors['bg_accent'])
         rect_border = self.create_rounded_rect(canvas, 1, 1, 199, 39, 10, outline=self.colors['border'], fill="", width=2)
 
+        validate_opts = {'validate': 'key', 'validatecommand': validation_cmd} if validation_cmd else {}
         entry = tk.Entry(
             container, textvariable=textvariable, bg=self.colors['bg_accent'], fg=self.colors['text_primary'],
             relief='flat', font=self.fonts['body'], insertbackground=self.colors['accent'], justify='center',
-            validate='key', validatecommand=validation_cmd
+            **validate_opts
         )
         entry.place(x=10, y=10, width=180, height=20)
 
@@ -315,19 +414,41 @@ class GifStudioPro:
         self.root = root
         self.setup_theme_and_style()
 
-        self.temp_dir: Path = Path(tempfile.mkdtemp(prefix="gif_studio_"))
+        # One working directory for the whole session, reused across GIF
+        # runs; TemporaryDirectory owns the cleanup. Resolved once so
+        # everything downstream can use the path as-is
+        self._temp_dir_ctx = tempfile.TemporaryDirectory(prefix="gif_studio_")
+        self.temp_dir: Path = Path(self._temp_dir_ctx.name).resolve()
         self.video_path: Optional[Path] = None
         self.gif_path: Optional[Path] = None
         self.video_info: Optional[Dict[str, Any]] = None
+        self._video_info_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._ffprobe_path: Optional[Path] = None
+        self._ffprobe_checked: bool = False
         self.ffmpeg_path: Optional[Path] = self.find_ffmpeg()
 
-        self.active_thread: Optional[CancellableThread] = None
+        self._last_gif_settings: Optional[Tuple] = None
+        self._pending_gif_settings: Optional[Tuple] = None
+
+        # One persistent pool instead of a fresh thread per operation;
+        # workers stay warm between downloads/encodes.
+        self.worker_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gif_studio_worker')
+        self.active_future: Optional[Future] = None
+        self.cancel_event = threading.Event()
         self.active_ffmpeg_process: Optional[FFmpegProcessManager] = None
         self.is_processing: bool = False
 
+        self._pending_progress: Tuple[float, str] = (0.0, "")
+        self._progress_job: Optional[str] = None
+
+        self._preview_wait_bound: bool = False
+        self._preview_cache_key: Optional[Tuple] = None
+        self._active_preview_queue: Optional[queue.Queue] = None
         self.preview_animation_id: Optional[str] = None
-        self.animation_frames: List[ImageTk.PhotoImage] = []
-        self.animation_frame_delays: List[int] = []
+        # Lists while frames stream in, frozen to tuples once complete
+        self.animation_frames: Tuple[ImageTk.PhotoImage, ...] = ()
+        self.animation_frame_delays: Tuple[int, ...] = ()
+        self.animation_delay: int = 50
         self.current_frame_index: int = 0
 
         self.logo_image: Optional[ImageTk.PhotoImage] = None
@@ -343,14 +464,17 @@ class GifStudioPro:
     def load_logo(self):
         """Loads and resizes logo from bam.png file."""
         try:
-            logo_path = Path("bam.png")
-            if logo_path.exists():
-                with Image.open(logo_path) as pil_image:
-                    max_height = 80
-                    ratio = max_height / pil_image.height
-                    new_width = int(pil_image.width * ratio)
-                    resized_image = pil_image.resize((new_width, max_height), Image.Resampling.LANCZOS)
-                    self.logo_image = ImageTk.PhotoImage(resized_image)
+            # Open directly instead of exists()-then-open: one filesystem
+            # touch, and no race between the check and the open
+            with Image.open("bam.png") as pil_image:
+                max_height = 80
+                ratio = max_height / pil_image.height
+                new_width = int(pil_image.width * ratio)
+                # reducing_gap enables Pillow's two-step C reduce for big downscales
+                resized_image = pil_image.resize((new_width, max_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+                self.logo_image = ImageTk.PhotoImage(resized_image)
+        except FileNotFoundError:
+            self.logo_image = None  # Optional asset; the text header is used instead
         except Exception as e:
             print(f"Logo loading error: {e}")
             self.logo_image = None
@@ -379,6 +503,20 @@ class GifStudioPro:
         self.root.configure(bg=self.colors['bg'])
         self.widget_helper = CustomWidgetHelper(self.colors, self.fonts)
 
+        # One shared Combobox style; rebuilding it per dropdown re-ran
+        # theme_use and the option database writes three times over
+        style = ttk.Style(self.root)
+        style.theme_use('default')
+        style.map('GifStudio.TCombobox',
+                  fieldbackground=[('readonly', self.colors['bg_accent'])],
+                  background=[('readonly', self.colors['bg_accent'])],
+                  foreground=[('readonly', self.colors['text_primary'])])
+        style.configure('GifStudio.TCombobox', padding=5, bordercolor=self.colors['border'])
+
+        self.root.option_add('*TCombobox*Listbox.background', self.colors['bg_accent'])
+        self.root.option_add('*TCombobox*Listbox.foreground', self.colors['text_primary'])
+        self.root.option_add('*TCombobox*Listbox.selectBackground', self.colors['accent'])
+
     def _create_main_layout(self):
         """Creates and arranges main interface elements."""
         header = tk.Frame(self.root, bg=self.colors['bg'])
@@ -396,7 +534,7 @@ class GifStudioPro:
         author_label = tk.Label(logo_container, text="created by zazauserr", font=self.fonts['signature'],
                                 fg=self.colors['gold'], bg=self.colors['bg'], cursor="hand2")
         author_label.pack(pady=(5, 0))
-        author_label.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/zazauserr", new=2))
+        author_label.bind("<Button-1>", lambda e: open_url_async("https://github.com/zazauserr"))
 
         main_container = tk.Frame(self.root, bg=self.colors['bg'])
         main_container.pack(fill='both', expand=True, padx=20, pady=(0, 20))
@@ -417,13 +555,17 @@ class GifStudioPro:
 
     def _populate_left_panel(self):
         """Populates left panel with control elements."""
+        # Bound once; these dicts are hit dozens of times while building
+        colors, fonts = self.colors, self.fonts
         self._create_panel_header(self.left_panel, "Source")
 
-        url_container = tk.Frame(self.left_panel, bg=self.colors['bg_panel'])
+        url_container = tk.Frame(self.left_panel, bg=colors['bg_panel'])
         url_container.pack(fill='x', padx=20, pady=5)
 
         self.url_var = tk.StringVar()
-        url_entry_container, self.url_entry = self.widget_helper.create_custom_entry(url_container, self.url_var, validation_cmd=(self.root.register(lambda P: True), '%P'))
+        # No validator: the old accept-everything lambda cost a Tcl->Python
+        # round trip on every keystroke
+        url_entry_container, self.url_entry = self.widget_helper.create_custom_entry(url_container, self.url_var)
         url_entry_container.pack(side='left', fill='x', expand=True, ipady=5)
 
         self.url_entry.bind('<FocusIn>', self.on_entry_focus_in)
@@ -431,36 +573,37 @@ class GifStudioPro:
         self.on_entry_focus_out(type('obj', (object,), {'widget': self.url_entry}))
 
         paste_button = tk.Button(url_container, text="📋", command=self.paste_from_clipboard,
-                                 font=("Segoe UI", 12), relief='flat', fg=self.colors['accent'],
-                                 bg=self.colors['bg_accent'], activebackground=self.colors['border'],
-                                 activeforeground=self.colors['text_primary'], bd=0)
+                                 font=("Segoe UI", 12), relief='flat', fg=colors['accent'],
+                                 bg=colors['bg_accent'], activebackground=colors['border'],
+                                 activeforeground=colors['text_primary'], bd=0)
         paste_button.pack(side='left', padx=5, ipady=1)
 
         self.load_btn = self.widget_helper.create_custom_button(url_container, "UPLOAD", self.start_download, 100, 36)
         self.load_btn.pack(side='right', padx=(5, 0))
 
         self._create_panel_header(self.left_panel, "Settings")
-        settings_frame = tk.Frame(self.left_panel, bg=self.colors['bg_panel'])
+        settings_frame = tk.Frame(self.left_panel, bg=colors['bg_panel'])
         settings_frame.pack(fill='both', expand=True, padx=30, pady=10)
 
+        # Registered once; both time entries share the same Tcl command
         vcmd = (self.root.register(self.validate_time_input), '%P')
 
-        tk.Label(settings_frame, text="START (sec)", font=self.fonts['h2'], fg=self.colors['text_secondary'], bg=self.colors['bg_panel']).pack()
+        tk.Label(settings_frame, text="START (sec)", font=fonts['h2'], fg=colors['text_secondary'], bg=colors['bg_panel']).pack()
         self.start_var = tk.StringVar(value="0.0")
         start_cont, self.start_entry = self.widget_helper.create_custom_entry(settings_frame, self.start_var, vcmd)
         start_cont.pack()
 
-        tk.Label(settings_frame, text="END (sec)", font=self.fonts['h2'], fg=self.colors['text_secondary'], bg=self.colors['bg_panel']).pack(pady=(10,0))
+        tk.Label(settings_frame, text="END (sec)", font=fonts['h2'], fg=colors['text_secondary'], bg=colors['bg_panel']).pack(pady=(10,0))
         self.end_var = tk.StringVar(value="5.0")
         end_cont, self.end_entry = self.widget_helper.create_custom_entry(settings_frame, self.end_var, vcmd)
         end_cont.pack()
 
         self.duration_var = tk.StringVar(value="Duration: 5.0 sec")
-        tk.Label(self.left_panel, textvariable=self.duration_var, font=self.fonts['body'], fg=self.colors['accent'], bg=self.colors['bg_panel']).pack(pady=5)
+        tk.Label(self.left_panel, textvariable=self.duration_var, font=fonts['body'], fg=colors['accent'], bg=colors['bg_panel']).pack(pady=5)
         self.start_var.trace_add('write', self.update_duration)
         self.end_var.trace_add('write', self.update_duration)
 
-        params_frame = tk.Frame(settings_frame, bg=self.colors['bg_panel'])
+        params_frame = tk.Frame(settings_frame, bg=colors['bg_panel'])
         params_frame.pack(pady=5, fill='x', expand=True)
         self.width_var = tk.StringVar()
         self.fps_var = tk.StringVar()
@@ -471,28 +614,29 @@ class GifStudioPro:
 
     def _populate_right_panel(self):
         """Populates right panel with control elements."""
+        colors, fonts = self.colors, self.fonts
         self.right_panel.grid_rowconfigure(0, weight=6)
         self.right_panel.grid_rowconfigure(1, weight=2)
         self.right_panel.grid_rowconfigure(2, weight=1)
         self.right_panel.grid_columnconfigure(0, weight=1)
 
-        preview_frame = tk.Frame(self.right_panel, bg=self.colors['bg_accent'])
+        preview_frame = tk.Frame(self.right_panel, bg=colors['bg_accent'])
         preview_frame.grid(row=0, column=0, sticky='nsew', padx=20, pady=(20, 10))
-        self.preview_label = tk.Label(preview_frame, text="[ PREVIEW ]", bg=self.colors['bg_accent'], fg=self.colors['border'], font=self.fonts['title'])
+        self.preview_label = tk.Label(preview_frame, text="[ PREVIEW ]", bg=colors['bg_accent'], fg=colors['border'], font=fonts['title'])
         self.preview_label.pack(expand=True, fill='both')
 
-        status_frame = tk.Frame(self.right_panel, bg=self.colors['bg_panel'])
+        status_frame = tk.Frame(self.right_panel, bg=colors['bg_panel'])
         status_frame.grid(row=1, column=0, sticky='nsew', padx=20)
-        self.info_text = tk.Text(status_frame, height=3, font=self.fonts['small'], bg=self.colors['bg_panel'], fg=self.colors['text_secondary'], relief='flat', bd=0, wrap='word', state='disabled')
+        self.info_text = tk.Text(status_frame, height=3, font=fonts['small'], bg=colors['bg_panel'], fg=colors['text_secondary'], relief='flat', bd=0, wrap='word', state='disabled')
         self.info_text.pack(fill='x', pady=(5,0))
 
         self.status_var = tk.StringVar(value="> Ready to go...")
-        tk.Label(status_frame, textvariable=self.status_var, font=self.fonts['body'], fg=self.colors['text_primary'], bg=self.colors['bg_panel'], anchor='w', wraplength=500).pack(fill='x')
-        self.progress_canvas = tk.Canvas(status_frame, width=400, height=10, bg=self.colors['bg_accent'], highlightthickness=0)
+        tk.Label(status_frame, textvariable=self.status_var, font=fonts['body'], fg=colors['text_primary'], bg=colors['bg_panel'], anchor='w', wraplength=500).pack(fill='x')
+        self.progress_canvas = tk.Canvas(status_frame, width=400, height=10, bg=colors['bg_accent'], highlightthickness=0)
         self.progress_canvas.pack(fill='x', pady=5)
-        self.progress_fill = self.widget_helper.create_rounded_rect(self.progress_canvas, 0, 0, 0, 10, 5, fill=self.colors['accent'], outline="")
+        self.progress_fill = self.widget_helper.create_rounded_rect(self.progress_canvas, 0, 0, 0, 10, 5, fill=colors['accent'], outline="")
 
-        actions_frame = tk.Frame(self.right_panel, bg=self.colors['bg_panel'])
+        actions_frame = tk.Frame(self.right_panel, bg=colors['bg_panel'])
         actions_frame.grid(row=2, column=0, sticky='sew', padx=20, pady=(10, 20))
         actions_frame.grid_columnconfigure((0,1), weight=1)
 
@@ -509,21 +653,8 @@ class GifStudioPro:
         frame.pack(fill='x', pady=8)
         tk.Label(frame, text=label_text, font=self.fonts['h2'], fg=self.colors['text_secondary'], bg=self.colors['bg_panel']).pack(side='left')
 
-        style = ttk.Style()
-        combo_style_name = f'{label_text}.TCombobox'
-        style.theme_use('default')
-        style.map(combo_style_name,
-                  fieldbackground=[('readonly', self.colors['bg_accent'])],
-                  background=[('readonly', self.colors['bg_accent'])],
-                  foreground=[('readonly', self.colors['text_primary'])])
-        style.configure(combo_style_name, padding=5, bordercolor=self.colors['border'])
-
-        self.root.option_add('*TCombobox*Listbox.background', self.colors['bg_accent'])
-        self.root.option_add('*TCombobox*Listbox.foreground', self.colors['text_primary'])
-        self.root.option_add('*TCombobox*Listbox.selectBackground', self.colors['accent'])
-
         combo = ttk.Combobox(frame, textvariable=variable, values=values, font=self.fonts['body'],
-                             state='readonly', width=12, style=combo_style_name)
+                             state='readonly', width=12, style='GifStudio.TCombobox')
         combo.pack(side='right')
         variable.set(default_value)
 
@@ -537,7 +668,7 @@ class GifStudioPro:
 
         link = tk.Label(self.ffmpeg_finder_frame, text="Download FFmpeg", font=self.fonts['body'], fg=self.colors['accent'], bg=self.colors['bg'], cursor="hand2")
         link.pack(pady=5)
-        link.bind("<Button-1>", lambda e: webbrowser.open("https://ffmpeg.org/download.html", new=2))
+        link.bind("<Button-1>", lambda e: open_url_async("https://ffmpeg.org/download.html"))
 
         self.widget_helper.create_custom_button(self.ffmpeg_finder_frame, "SELECT PATH", self.select_ffmpeg_path, 180, 40).pack(pady=20)
 
@@ -545,7 +676,9 @@ class GifStudioPro:
         """Opens file selection dialog for ffmpeg.exe."""
         path = filedialog.askopenfilename(title="Select ffmpeg.exe", filetypes=[("Executable", "*.exe"), ("All files", "*.*")])
         if path:
-            self.ffmpeg_path = Path(path)
+            self.ffmpeg_path = Path(path).resolve()
+            self._ffprobe_checked = False  # ffprobe lives next to the new ffmpeg
+            self._save_ffmpeg_hint(self.ffmpeg_path)
             self.ffmpeg_finder_frame.destroy()
             self.update_ui_state()
 
@@ -609,7 +742,16 @@ class GifStudioPro:
             self.cancel_btn.place_forget()
 
     def update_progress(self, progress: float, message: str = ""):
-        """Updates progress bar."""
+        """Updates progress bar, coalescing bursts into a single redraw."""
+        self._pending_progress = (progress, message)
+        if self._progress_job is None:
+            self._progress_job = self.root.after_idle(self._apply_progress)
+
+    def _apply_progress(self):
+        """Applies the most recent pending progress value to the canvas."""
+        self._progress_job = None
+        progress, message = self._pending_progress
+
         if progress >= 0:
             canvas_width = self.progress_canvas.winfo_width()
             fill_width = int((progress / 100) * canvas_width)
@@ -626,44 +768,80 @@ class GifStudioPro:
         self.info_text.config(state='disabled')
 
     # --- Video Processing ---
+    def _load_ffmpeg_hint(self) -> Tuple[Optional[Path], bool]:
+        """Reads the FFmpeg location cached by a previous run.
+
+        The second element is True when the binary is provably the same
+        file that passed the last probe (mtime and size match), in which
+        case re-probing it would be redundant.
+        """
+        try:
+            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                # Valid JSON but not our format (hand-edited or clobbered
+                # by another tool) - treat it like a missing hint
+                return None, False
+            hint = data.get('ffmpeg_path')
+            if hint:
+                path = Path(hint)
+                st = os.stat(path)
+                if stat.S_ISREG(st.st_mode):
+                    verified = (data.get('ffmpeg_mtime') == st.st_mtime
+                                and data.get('ffmpeg_size') == st.st_size)
+                    return path, verified
+        except (OSError, ValueError):
+            pass
+        return None, False
+
+    def _save_ffmpeg_hint(self, path: Path):
+        """Persists the FFmpeg location so later launches skip the scan."""
+        try:
+            st = os.stat(path)
+            with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
+                json.dump({'ffmpeg_path': str(path),
+                           'ffmpeg_mtime': st.st_mtime,
+                           'ffmpeg_size': st.st_size}, f)
+        except OSError as e:
+            print(f"Config save error: {e}")
+
     def find_ffmpeg(self) -> Optional[Path]:
         """Searches for FFmpeg in system with improved search logic."""
-        possible_names = ['ffmpeg.exe', 'ffmpeg'] if sys.platform == 'win32' else ['ffmpeg']
-
-        # First check PATH
-        for name in possible_names:
-            found_path = shutil.which(name)
+        # Cached hint first: an unchanged binary needs no probe at all,
+        # a changed one gets a single probe instead of a full scan
+        hint, verified = self._load_ffmpeg_hint()
+        if hint and (verified or self.test_ffmpeg(hint)):
+            return hint.resolve()
+
+        # Gather candidates with cheap checks only: PATH lookups first,
+        # then the well-known locations
+        candidates: List[Path] = []
+        for name in FFMPEG_NAMES:
+            found_path = cached_which(name)
             if found_path:
-                path = Path(found_path)
-                if self.test_ffmpeg(path):
-                    return path
-
-        # Check local paths
-        local_paths = [
-            Path.cwd() / "ffmpeg.exe",
-            Path.cwd() / "ffmpeg",
-            Path.cwd() / "bin" / "ffmpeg.exe",
-            Path.cwd() / "bin" / "ffmpeg"
-        ]
-
-        # System paths
-        if sys.platform == 'win32':
-            system_paths = [
-                Path("C:/ffmpeg/bin/ffmpeg.exe"),
-                Path("C:/Program Files/ffmpeg/bin/ffmpeg.exe"),
-                Path("C:/Program Files (x86)/ffmpeg/bin/ffmpeg.exe")
-            ]
-        else:
-            system_paths = [
-                Path("/usr/bin/ffmpeg"),
-                Path("/usr/local/bin/ffmpeg"),
-                Path("/opt/homebrew/bin/ffmpeg")
-            ]
-
-        all_paths = local_paths + system_paths
+                candidates.append(Path(found_path))
 
-        for path in all_paths:
-            if path.exists() and path.is_file() and self.test_ffmpeg(path):
+        for path in FFMPEG_LOCAL_PATHS + FFMPEG_SYSTEM_PATHS:
+            # One os.stat answers both exists() and is_file(), which each
+            # cost their own syscall per candidate
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                candidates.append(path)
+
+        # Probe candidates in priority order; the first (winning) one is
+        # normally the only subprocess spawned
+        seen = set()
+        for path in candidates:
+            key = str(path)
+            if key in seen:
+                continue
+            seen.add(key)
+            if self.test_ffmpeg(path):
+                path = path.resolve()
+                self._save_ffmpeg_hint(path)
                 return path
 
         return None
@@ -678,49 +856,96 @@ class GifStudioPro:
                 startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
                 startupinfo.wShowWindow = subprocess.SW_HIDE
 
+            # Output goes straight to the bit bucket: the exit status of
+            # `ffmpeg -version` is all the probe needs, so no pipes are
+            # created and no multi-KB banner is buffered or decoded
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=15,
                 startupinfo=startupinfo
             )
 
-            return (result.returncode == 0 and
-                    'ffmpeg version' in result.stdout.lower())
+            return result.returncode == 0
         except Exception as e:
             print(f"FFmpeg testing error {ffmpeg_path}: {e}")
             return False
 
+    def _locate_ffprobe(self) -> Optional[Path]:
+        """Finds ffprobe next to ffmpeg; the lookup runs once per session."""
+        if not self._ffprobe_checked:
+            ffprobe_name = "ffprobe.exe" if sys.platform == 'win32' else "ffprobe"
+            candidate = self.ffmpeg_path.parent / ffprobe_name
+            self._ffprobe_path = candidate if candidate.exists() else None
+            self._ffprobe_checked = True
+        return self._ffprobe_path
+
     def get_video_info(self, video_path: Path) -> Dict[str, Any]:
-        """Gets video information using FFprobe."""
+        """Gets video information using FFprobe, cached per file identity.
+
+        Keyed on (path, mtime, size) so a re-download that lands under
+        the same temp filename misses the cache and gets re-probed.
+        """
         try:
-            # Try to find ffprobe next to ffmpeg
-            ffprobe_name = "ffprobe.exe" if sys.platform == 'win32' else "ffprobe"
-            ffprobe_path = self.ffmpeg_path.parent / ffprobe_name
-            
-            use_ffprobe = ffprobe_path.exists()
-            
-            if use_ffprobe:
-                cmd = [str(ffprobe_path), '-v', 'quiet', '-print_format', 'json', '-show_format', str(video_path)]
+            st = os.stat(video_path)
+        except OSError:
+            return {'duration': 0}
+        key = (str(video_path), st.st_mtime, st.st_size)
+
+        cached = self._video_info_cache.get(key)
+        if cached is not None:
+            return cached
+
+        info = self._probe_video_info(video_path)
+        self._video_info_cache[key] = info
+        return info
+
+    def _probe_video_info(self, video_path: Path) -> Dict[str, Any]:
+        """Runs the actual FFprobe/FFmpeg probe for get_video_info."""
+        try:
+            ffprobe_path = self._locate_ffprobe()
+
+            if ffprobe_path:
+                # One call returns format and video-stream data together,
+                # so width/fps never need a second probe later
+                cmd = [str(ffprobe_path), '-v', 'quiet', '-print_format', 'json',
+                       '-show_format', '-show_streams', '-select_streams', 'v:0', str(video_path)]
+                # Only stdout carries the JSON; don't pipe or decode the rest
+                result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, text=True, timeout=30,
+                                        encoding='utf-8', errors='replace')
             else:
                 # If ffprobe not found, use ffmpeg to get information
+                # (the Duration line it parses lives on stderr)
                 cmd = [str(self.ffmpeg_path), '-i', str(video_path), '-f', 'null', '-']
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, encoding='utf-8', errors='replace')
-            
-            if use_ffprobe and result.returncode == 0:
-                info = json.loads(result.stdout)
-                duration = float(info['format']['duration'])
-                return {'duration': duration}
+                result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE, text=True, timeout=30,
+                                        encoding='utf-8', errors='replace')
+
+            if ffprobe_path and result.returncode == 0:
+                probe = json.loads(result.stdout)
+                info = {'duration': float(probe['format']['duration'])}
+                streams = probe.get('streams') or []
+                if streams:
+                    stream = streams[0]
+                    info['width'] = stream.get('width', 0)
+                    info['height'] = stream.get('height', 0)
+                    num, _, den = (stream.get('avg_frame_rate') or '0/1').partition('/')
+                    try:
+                        info['fps'] = round(int(num) / int(den or 1), 2) if int(den or 1) else 0
+                    except ValueError:
+                        info['fps'] = 0
+                return info
             else:
                  # Simple parsing of FFmpeg output to get duration
-                duration_match = re.search(r"Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})", result.stderr)
+                duration_match = DURATION_RE.search(result.stderr)
                 if duration_match:
                     h, m, s, ms = map(int, duration_match.groups())
                     duration = h * 3600 + m * 60 + s + ms / 100
                     return {'duration': duration}
-            
+
             return {'duration': 0}
 
         except Exception as e:
@@ -734,15 +959,15 @@ class GifStudioPro:
             messagebox.showwarning("Warning", "Enter video URL")
             return
 
-        if self.active_thread:
+        if self.active_future and not self.active_future.done():
             return
 
         self.is_processing = True
         self.update_ui_state()
         self.update_progress(0, "Starting download...")
 
-        self.active_thread = CancellableThread(target=self.download_video, args=(url,))
-        self.active_thread.start()
+        self.cancel_event.clear()
+        self.active_future = self.worker_pool.submit(self.download_video, url)
 
     def download_video(self, url: str):
         """Downloads video using yt-dlp."""
@@ -757,7 +982,7 @@ class GifStudioPro:
             }
 
             def progress_hook(d):
-                if self.active_thread and self.active_thread.stopped():
+                if self.cancel_event.is_set():
                     raise Exception("Download canceled")
 
                 if d['status'] == 'downloading':
@@ -771,14 +996,26 @@ class GifStudioPro:
 
             ydl_opts['progress_hooks'] = [progress_hook]
 
+            downloaded_path = None
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-
-            # Find downloaded file
-            for file in self.temp_dir.glob("downloaded_video.*"):
-                if file.is_file():
-                    self.video_path = file
-                    break
+                info = ydl.extract_info(url, download=True)
+                # yt-dlp already knows exactly where the file landed; no
+                # need to re-scan the temp directory afterwards
+                if info:
+                    requested = info.get('requested_downloads') or []
+                    if requested and requested[0].get('filepath'):
+                        downloaded_path = Path(requested[0]['filepath'])
+                    else:
+                        downloaded_path = Path(ydl.prepare_filename(info))
+
+            if downloaded_path and downloaded_path.is_file():
+                self.video_path = downloaded_path.resolve()
+            else:
+                # Fallback for older yt-dlp metadata: find downloaded file
+                for file in self.temp_dir.glob("downloaded_video.*"):
+                    if file.is_file():
+                        self.video_path = file.resolve()
+                        break
 
             if self.video_path:
                 self.video_info = self.get_video_info(self.video_path)
@@ -790,14 +1027,23 @@ class GifStudioPro:
             if "canceled" not in str(e):
                 self.root.after(0, self.on_download_error, str(e))
         finally:
-            self.active_thread = None
+            self.active_future = None
 
     def on_video_loaded(self):
         """Handler for successful video loading."""
+        # New source under the same temp filename invalidates the skip cache
+        self._last_gif_settings = None
         duration = self.video_info.get('duration', 0)
         self.end_var.set(str(min(5.0, duration)))
 
         info_text = f"Video uploaded successfully\nDuration: {duration:.1f} sec"
+        width, height = self.video_info.get('width'), self.video_info.get('height')
+        if width and height:
+            source = f"{width}x{height}"
+            fps = self.video_info.get('fps')
+            if fps:
+                source += f" @ {fps:g} fps"
+            info_text += f"\nSource: {source}"
         self.update_info_display(info_text)
         self.update_progress(100, "Video ready for processing")
 
@@ -834,15 +1080,24 @@ class GifStudioPro:
             messagebox.showwarning("Warning", "Enter correct time values")
             return
 
+        # Identical settings produce an identical GIF; skip the re-encode
+        settings = (str(self.video_path), start_time, end_time,
+                    self.width_var.get(), self.fps_var.get(), self.quality_var.get())
+        if (settings == self._last_gif_settings
+                and self.gif_path and self.gif_path.exists()):
+            self.update_progress(100, "GIF is up to date")
+            return
+        self._pending_gif_settings = settings
+
         self.is_processing = True
         self.update_ui_state()
         self.update_progress(0, "Creating GIF...")
 
-        self.active_thread = CancellableThread(target=self.create_gif)
-        self.active_thread.start()
+        self.cancel_event.clear()
+        self.active_future = self.worker_pool.submit(self.create_gif)
 
     def create_gif(self):
-        """Creates GIF with improved error handling."""
+        """Creates GIF in a single FFmpeg pass with improved error handling."""
         try:
             start_time = float(self.start_var.get())
             end_time = float(self.end_var.get())
@@ -852,10 +1107,9 @@ class GifStudioPro:
 
             duration = end_time - start_time
 
-            # Use absolute paths
-            output_path = self.temp_dir.resolve() / TEMP_GIF_FILENAME
-            palette_path = self.temp_dir.resolve() / TEMP_PALETTE_FILENAME
-            video_path = self.video_path.resolve()
+            # Paths are resolved once at assignment, so no per-run resolve here
+            output_path = self.temp_dir / TEMP_GIF_FILENAME
+            video_path = self.video_path
 
             # File existence checks
             if not video_path.exists():
@@ -866,118 +1120,49 @@ class GifStudioPro:
                 self.root.after(0, self.on_gif_error, f"FFmpeg not found: {self.ffmpeg_path}")
                 return
 
-            # Clear old files with improved error handling
-            for file in [output_path, palette_path]:
-                if file.exists():
+            # Clear old output by staging: one os.replace moves it aside
+            # immediately (no retry/backoff loop), then the stale copy is
+            # deleted best-effort - anything still held open gets swept
+            # with the temp directory at exit
+            if output_path.exists():
+                stale_path = output_path.with_suffix(f'.stale_{int(time.time() * 1000)}')
+                try:
+                    os.replace(output_path, stale_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as replace_error:
+                    self.root.after(0, self.on_gif_error, f"Failed to clear temporary file: {replace_error}")
+                    return
+                else:
                     try:
-                        file.unlink()
-                        time.sleep(0.1)  # Small delay for file release
-                    except PermissionError:
-                        # Try to rename file if can't delete
-                        try:
-                            backup_path = file.with_suffix(f'.backup_{int(time.time())}')
-                            file.rename(backup_path)
-                        except Exception as rename_error:
-                            self.root.after(0, self.on_gif_error, f"Failed to clear temporary file: {rename_error}")
-                            return
-                    except Exception as e:
-                        print(f"Warning: failed to delete {file}: {e}")
+                        stale_path.unlink()
+                    except OSError as e:
+                        print(f"Warning: failed to delete {stale_path}: {e}")
 
             # Create directory if doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            palette_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Quality settings (simplified to avoid errors)
-            quality_settings = {
-                'fast': 'stats_mode=single',
-                'medium': 'stats_mode=diff',  # Changed from full to diff
-                'high': 'stats_mode=diff:max_colors=256'  # Changed from full to diff
-            }
-
-            palette_gen = quality_settings.get(quality, quality_settings['medium'])
-
-            # Simplified palette creation command with parameter checking
-            palette_cmd = [
-                str(self.ffmpeg_path.resolve()),
-                '-y',
-                '-ss', f'{start_time:.3f}',
-                '-t', f'{duration:.3f}',
-                '-i', str(video_path),
-                '-vf', f'scale={width}:-1:flags=lanczos,palettegen={palette_gen}',
-                '-vframes', '1',  # NEW CHANGE: Explicitly specify only one frame needed
-                '-loglevel', 'warning',
-                str(palette_path)
-            ]
-
-            print(f"Palette command: {' '.join(palette_cmd)}")
-
-            # Start palette creation
-            palette_manager = FFmpegProcessManager(
-                palette_cmd,
-                self.on_palette_progress,
-                self.on_palette_complete,
-                duration
-            )
-
-            self.active_ffmpeg_process = palette_manager
-            palette_manager.run()
-
-        except Exception as e:
-            self.root.after(0, self.on_gif_error, f"Configuration error: {str(e)}")
-
-    def on_palette_progress(self, progress: float, message: str):
-            """Palette creation progress handler."""
-            if progress >= 0:
-                self.root.after(0, self.update_progress, progress * 0.3, f"Creating palette: {progress:.1f}%")
-            else:
-                self.root.after(0, self.update_progress, -1, f"Palette: {message[:60]}...")
-
-    def on_palette_complete(self, return_code: int, error_message: str):
-        """Palette creation completion handler with improved handling."""
-        if return_code != 0:
-            error_msg = error_message or f"Palette creation error (code {return_code})"
-            self.root.after(0, self.on_gif_error, error_msg)
-            return
-
-        palette_path = self.temp_dir.resolve() / TEMP_PALETTE_FILENAME
-        if not palette_path.exists() or palette_path.stat().st_size == 0:
-            self.root.after(0, self.on_gif_error, "Palette file not created or empty")
-            return
 
-        if self.active_thread and self.active_thread.stopped():
-            return
+            # Single-pass graph: palettegen and paletteuse share one decode
+            # via split, so the source video is read and scaled only once
+            filter_graph = build_filter_graph(width, fps, quality)
 
-        # GIF creation with improved parameters
-        try:
-            start_time = float(self.start_var.get())
-            end_time = float(self.end_var.get())
-            width = int(self.width_var.get())
-            fps = int(self.fps_var.get())
-            quality = self.quality_var.get()
+            # Let the decoder and filter graph use all cores
+            n_threads = str(os.cpu_count() or 2)
 
-            duration = end_time - start_time
-            output_path = self.temp_dir.resolve() / TEMP_GIF_FILENAME
-            video_path = self.video_path.resolve()
-
-            # Dithering settings (simplified)
-            dither_settings = {
-                'fast': 'dither=none',
-                'medium': 'dither=bayer:bayer_scale=2',
-                'high': 'dither=floyd_steinberg'  # Changed to more stable algorithm
-            }
-
-            dither = dither_settings.get(quality, dither_settings['medium'])
-
-            # Simplified and more stable GIF creation command
             gif_cmd = [
-                str(self.ffmpeg_path.resolve()),
+                str(self.ffmpeg_path),
                 '-y',
+                '-threads', '0',
+                '-filter_threads', n_threads,
+                '-filter_complex_threads', n_threads,
+                # Input seeking: -ss before -i jumps via the demuxer index
+                # instead of decoding up to the start point
+                '-fflags', '+fastseek',
                 '-ss', f'{start_time:.3f}',
                 '-t', f'{duration:.3f}',
                 '-i', str(video_path),
-                '-i', str(palette_path),
-                '-filter_complex', f'[0:v]scale={width}:-1:flags=lanczos,fps={fps}[v];[v][1:v]paletteuse={dither}',
-                '-loglevel', 'warning',
+                '-filter_complex', filter_graph,
+                '-loop', '0',
                 '-f', 'gif',  # Explicitly specify output format
                 str(output_path)
             ]
@@ -1000,7 +1185,7 @@ class GifStudioPro:
     def on_gif_progress(self, progress: float, message: str):
         """GIF creation progress handler."""
         if progress >= 0:
-            self.root.after(0, self.update_progress, 30 + progress * 0.7, f"Creating GIF: {progress:.1f}%")
+            self.root.after(0, self.update_progress, progress, f"Creating GIF: {progress:.1f}%")
         else:
             self.root.after(0, self.update_progress, -1, f"GIF: {message[:60]}...")
 
@@ -1019,6 +1204,7 @@ class GifStudioPro:
 
     def on_gif_created(self):
         """Successful GIF creation handler."""
+        self._last_gif_settings = self._pending_gif_settings
         self.update_progress(100, "GIF created successfully!")
 
         # Load GIF for preview
@@ -1030,7 +1216,7 @@ class GifStudioPro:
 
         self.is_processing = False
         self.active_ffmpeg_process = None
-        self.active_thread = None
+        self.active_future = None
         self.update_ui_state()
 
     def on_gif_error(self, error_message: str):
@@ -1040,48 +1226,128 @@ class GifStudioPro:
 
         self.is_processing = False
         self.active_ffmpeg_process = None
-        self.active_thread = None
+        self.active_future = None
         self.update_ui_state()
 
     # --- GIF Preview ---
     def load_gif_preview(self):
-        """Loads GIF for preview."""
+        """Loads GIF for preview, decoding frames off the UI thread."""
         if not self.gif_path or not self.gif_path.exists():
             return
 
-        try:
-            with Image.open(self.gif_path) as gif:
-                self.animation_frames = []
-                self.animation_frame_delays = []
-
-                # Get preview dimensions
-                preview_width = self.preview_label.winfo_width()
-                preview_height = self.preview_label.winfo_height()
+        # Get preview dimensions
+        preview_width = self.preview_label.winfo_width()
+        preview_height = self.preview_label.winfo_height()
 
-                if preview_width <= 1 or preview_height <= 1:
-                    # If dimensions not set yet, try later
-                    self.root.after(100, self.load_gif_preview)
-                    return
+        if preview_width <= 1 or preview_height <= 1:
+            # Wait for the geometry manager to lay the label out instead
+            # of polling the main loop on a timer
+            if not self._preview_wait_bound:
+                self._preview_wait_bound = True
+                self.preview_label.bind('<Configure>', self._on_preview_configured)
+            return
 
-                for frame in ImageSequence.Iterator(gif):
-                    # Scale frame for preview
-                    frame_copy = frame.copy()
-                    frame_copy.thumbnail((preview_width - 20, preview_height - 20), Image.Resampling.LANCZOS)
+        # Same GIF at the same size: the PhotoImage frames are still
+        # valid, so just restart the animation instead of redecoding
+        try:
+            st = self.gif_path.stat()
+        except OSError:
+            return
+        cache_key = (str(self.gif_path), st.st_mtime, st.st_size, preview_width, preview_height)
+        if cache_key == self._preview_cache_key and self.animation_frames:
+            self.stop_preview_animation()
+            self.current_frame_index = 0
+            self.start_preview_animation()
+            return
+        self._preview_cache_key = cache_key
 
-                    # Convert to PhotoImage
-                    photo = ImageTk.PhotoImage(frame_copy)
-                    self.animation_frames.append(photo)
+        self.stop_preview_animation()
+        self.animation_frames = []
+        self.animation_frame_delays = []
+
+        # Bounded queue keeps memory flat if the UI thread falls behind.
+        # It also marks which load owns the preview: a drain loop whose
+        # queue is no longer the active one discards and exits.
+        frame_queue: queue.Queue = queue.Queue(maxsize=8)
+        self._active_preview_queue = frame_queue
+        decode_thread = threading.Thread(
+            target=self._decode_preview_frames,
+            args=(self.gif_path, (preview_width - 20, preview_height - 20), frame_queue),
+            daemon=True
+        )
+        decode_thread.start()
+        self._drain_preview_queue(frame_queue)
+
+    def _on_preview_configured(self, event: tk.Event):
+        """Retries the preview load once the label has real geometry."""
+        if event.width > 1 and event.height > 1:
+            self.preview_label.unbind('<Configure>')
+            self._preview_wait_bound = False
+            self.load_gif_preview()
+
+    def _decode_preview_frames(self, gif_path: Path, box: Tuple[int, int], frame_queue: "queue.Queue"):
+        """Decodes and scales GIF frames in a background thread."""
+        try:
+            with Image.open(gif_path) as gif:
+                # All frames share the GIF canvas size, so the fit is
+                # computed once instead of per-frame inside thumbnail()
+                scale = min(box[0] / gif.width, box[1] / gif.height, 1.0)
+                target = (max(1, int(gif.width * scale)), max(1, int(gif.height * scale)))
 
-                    # Get frame delay
+                for frame in ImageSequence.Iterator(gif):
+                    # Convert out of palette mode here so ImageTk does not
+                    # redo it per frame on the Tk thread; RGBA also lets
+                    # the resize below interpolate instead of going NEAREST
+                    frame_copy = frame.convert('RGBA')
+                    if frame_copy.size != target:
+                        # BILINEAR is plenty for an animated on-screen
+                        # preview and noticeably cheaper than LANCZOS
+                        frame_copy = frame_copy.resize(target, Image.Resampling.BILINEAR, reducing_gap=2.0)
                     delay = frame.info.get('duration', 50)  # Default 50ms
-                    self.animation_frame_delays.append(delay)
-
-            if self.animation_frames:
-                self.current_frame_index = 0
-                self.start_preview_animation()
-
+                    frame_queue.put((frame_copy, delay))
         except Exception as e:
             print(f"GIF preview loading error: {e}")
+        finally:
+            frame_queue.put(None)  # End-of-stream marker
+
+    def _drain_preview_queue(self, frame_queue: "queue.Queue"):
+        """Converts decoded frames to PhotoImage on the UI thread."""
+        get = frame_queue.get_nowait
+        if frame_queue is not self._active_preview_queue:
+            # A newer load owns the preview now. Keep discarding until the
+            # sentinel so the stale decoder thread can finish its puts and
+            # exit instead of blocking forever on the bounded queue.
+            try:
+                while get() is not None:
+                    pass
+            except queue.Empty:
+                self.root.after(50, self._drain_preview_queue, frame_queue)
+            return
+        append_frame = self.animation_frames.append
+        append_delay = self.animation_frame_delays.append
+        try:
+            while True:
+                item = get()
+                if item is None:
+                    if self.animation_frames:
+                        # Frozen: the animation timer indexes these for as
+                        # long as the preview runs
+                        delays = self.animation_frame_delays
+                        self.animation_frames = tuple(self.animation_frames)
+                        self.animation_frame_delays = tuple(delays)
+                        # The encoder writes a constant frame delay, so one
+                        # period (the most common delay) drives the timer
+                        self.animation_delay = max(20, max(set(delays), key=delays.count))
+                        self.current_frame_index = 0
+                        self.start_preview_animation()
+                    return
+                frame, delay = item
+                # PhotoImage must be created on the Tk thread
+                append_frame(ImageTk.PhotoImage(frame))
+                append_delay(delay)
+        except queue.Empty:
+            pass
+        self.root.after(50, self._drain_preview_queue, frame_queue)
 
     def start_preview_animation(self):
         """Starts preview animation."""
@@ -1097,11 +1363,9 @@ class GifStudioPro:
         current_frame = self.animation_frames[self.current_frame_index]
         self.preview_label.config(image=current_frame, text="")
 
-        # Schedule next frame
-        delay = self.animation_frame_delays[self.current_frame_index]
+        # Schedule next frame at the fixed period
         self.current_frame_index = (self.current_frame_index + 1) % len(self.animation_frames)
-
-        self.preview_animation_id = self.root.after(delay, self.animate_preview)
+        self.preview_animation_id = self.root.after(self.animation_delay, self.animate_preview)
 
     def stop_preview_animation(self):
         """Stops preview animation."""
@@ -1123,7 +1387,11 @@ class GifStudioPro:
 
         if file_path:
             try:
-                shutil.copy2(self.gif_path, file_path)
+                # copyfile uses the kernel fast-copy path (sendfile /
+                # copy_file_range) and skips copy2's metadata pass; the
+                # temp GIF must stay in place for the preview and re-saves,
+                # so a rename is not an option here.
+                shutil.copyfile(self.gif_path, file_path)
                 messagebox.showinfo("Success", f"GIF saved: {file_path}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save file:\n{e}")
@@ -1131,8 +1399,7 @@ class GifStudioPro:
     # --- Operation Control ---
     def cancel_operation(self):
         """Cancels current operation."""
-        if self.active_thread:
-            self.active_thread.stop()
+        self.cancel_event.set()
 
         if self.active_ffmpeg_process:
             self.active_ffmpeg_process.terminate()
@@ -1145,8 +1412,7 @@ class GifStudioPro:
     def cleanup_temp_files(self):
         """Cleans up temporary files."""
         try:
-            if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
+            self._temp_dir_ctx.cleanup()
         except Exception as e:
             print(f"Temporary files cleanup error: {e}")
 
@@ -1154,6 +1420,7 @@ class GifStudioPro:
         """Application closing handler."""
         self.cancel_operation()
         self.stop_preview_animation()
+        self.worker_pool.shutdown(wait=False)
         self.cleanup_temp_files()
         self.root.destroy()
 